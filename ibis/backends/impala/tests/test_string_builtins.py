@@ -107,6 +107,11 @@ def table(mockcon):
             "locate('a', `string_col`, 3) - 1",
             id="find_with_offset",
         ),
+        pytest.param(
+            lambda s: s.find('a', 0),
+            "locate('a', `string_col`) - 1",
+            id="find_with_zero_offset",
+        ),
         pytest.param(
             lambda s: s.lpad(1, 'a'),
             "lpad(`string_col`, 1, 'a')",
@@ -1,16 +1,19 @@
+from __future__ import annotations
+
+import datetime
 import functools
 import math
 import operator
-from typing import Mapping
+import re
+from contextvars import ContextVar
+from typing import Any, Callable, Mapping
 
 import numpy as np
-import pandas as pd
 import polars as pl
 
 import ibis.common.exceptions as com
 import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
-import ibis.expr.schema as sch
 from ibis.backends.polars.datatypes import to_polars_type
 
 
@@ -23,9 +26,81 @@ def _assert_literal(op):
         )
 
 
-@functools.singledispatch
-def translate(expr):
-    raise NotImplementedError(expr)
+# translation rules registered for operation classes
+_registry: dict[type, Callable] = {}
+
+# translation rules resolved for concrete operation classes, see `_dispatch`
+_dispatch_cache: dict[type, Callable] = {}
+
+
+def _dispatch(cls: type) -> Callable:
+    """Return the translation rule of the closest registered base class."""
+    try:
+        return _dispatch_cache[cls]
+    except KeyError:
+        pass
+
+    for base in cls.__mro__:
+        if (func := _registry.get(base)) is not None:
+            _dispatch_cache[cls] = func
+            return func
+
+    raise NotImplementedError(cls)
+
+
+def _register(*classes: type) -> Callable:
+    def decorator(func):
+        for cls in classes:
+            _registry[cls] = func
+        _dispatch_cache.clear()
+        return func
+
+    return decorator
+
+
+# memo of already translated operations, allocated once per top level call
+_translation_cache: ContextVar[dict | None] = ContextVar(
+    "_translation_cache", default=None
+)
+
+
+def translate(op):
+    """Translate an ibis operation to its polars counterpart.
+
+    Operations shared by several parents (e.g. the same column referenced
+    from several selections and predicates, or a filtered table feeding both
+    an aggregation and a join against it) are translated only once per top
+    level call. The memo is keyed by identity rather than equality, because
+    equal operations may still translate differently (`Literal(0.0)` and
+    `Literal(-0.0)` compare and hash equal).
+    """
+    cache = _translation_cache.get()
+    if cache is None:
+        token = _translation_cache.set({})
+        try:
+            return translate(op)
+        finally:
+            _translation_cache.reset(token)
+
+    try:
+        return cache[id(op)][1]
+    except KeyError:
+        pass
+
+    result = _dispatch(op.__class__)(op)
+    # keep the operation alive so that its id cannot be reused during the call
+    cache[id(op)] = (op, result)
+    return result
+
+
+translate.register = _register
+translate.registry = _registry
+
+
+def _register_simple(mapping: Mapping[type, Any], builder: Callable) -> None:
+    """Register the rules built from the entry of each operation class."""
+    for cls, value in mapping.items():
+        translate.register(cls)(builder(value))
 
 
 @translate.register(ops.Node)
@@ -40,13 +115,15 @@ def table(op):
 
 @translate.register(ops.InMemoryTable)
 def pandas_in_memory_table(op):
-    lf = pl.from_pandas(op.data.to_frame()).lazy()
+    df = pl.from_pandas(op.data.to_frame())
+    lf = df.lazy()
 
+    # compare the polars types of the eager frame directly, instead of
+    # resolving the lazy plan's schema and converting it back to ibis
     columns = []
-    for name, current_dtype in sch.infer(lf).items():
-        desired_dtype = op.schema[name]
-        if current_dtype != desired_dtype:
-            typ = to_polars_type(desired_dtype)
+    for name, current_type in df.schema.items():
+        typ = to_polars_type(op.schema[name])
+        if current_type != typ:
             columns.append(pl.col(name).cast(typ))
 
     if columns:
@@ -66,20 +143,36 @@ def _make_duration(value, dtype):
     return pl.duration(**kwargs)
 
 
+def _literal_array(op):
+    value = pl.Series("", op.value)
+    typ = to_polars_type(op.dtype)
+    return pl.lit(value, dtype=typ).list()
+
+
+def _literal_struct(op):
+    values = [
+        pl.lit(v, dtype=to_polars_type(op.dtype[k])).alias(k)
+        for k, v in op.value.items()
+    ]
+    return pl.struct(values)
+
+
+def _literal_interval(op):
+    return _make_duration(op.value, op.dtype)
+
+
+# literals of these datatypes need more than a plain `pl.lit` call
+_literal_rules = {
+    dt.Array: _literal_array,
+    dt.Struct: _literal_struct,
+    dt.Interval: _literal_interval,
+}
+
+
 @translate.register(ops.Literal)
 def literal(op):
-    if isinstance(op.dtype, dt.Array):
-        value = pl.Series("", op.value)
-        typ = to_polars_type(op.dtype)
-        return pl.lit(value, dtype=typ).list()
-    elif isinstance(op.dtype, dt.Struct):
-        values = [
-            pl.lit(v, dtype=to_polars_type(op.dtype[k])).alias(k)
-            for k, v in op.value.items()
-        ]
-        return pl.struct(values)
-    elif isinstance(op.dtype, dt.Interval):
-        return _make_duration(op.value, op.dtype)
+    if (rule := _literal_rules.get(type(op.dtype))) is not None:
+        return rule(op)
     else:
         typ = to_polars_type(op.dtype)
         return pl.lit(op.value, dtype=typ)
@@ -115,10 +208,23 @@ def sort_key(op):
 
 @translate.register(ops.Selection)
 def selection(op):
-    lf = translate(op.table)
-
-    if op.predicates:
-        predicates = map(translate, op.predicates)
+    table = op.table
+    predicates = list(op.predicates)
+
+    # fuse the predicates of chained filters which neither project nor sort,
+    # so polars receives a single predicate to push down to the scan
+    while (
+        isinstance(table, ops.Selection)
+        and not table.selections
+        and not table.sort_keys
+    ):
+        predicates = [*table.predicates, *predicates]
+        table = table.table
+
+    lf = translate(table)
+
+    if predicates:
+        predicates = map(translate, predicates)
         predicate = functools.reduce(operator.and_, predicates)
         lf = lf.filter(predicate)
 
@@ -159,24 +265,16 @@ def aggregation(op):
     lf = translate(op.table)
 
     if op.predicates:
-        lf = lf.filter(
-            functools.reduce(
-                operator.and_,
-                map(translate, op.predicates),
-            )
-        )
+        predicates = map(translate, op.predicates)
+        lf = lf.filter(functools.reduce(operator.and_, predicates))
+
+    metrics = [translate(arg) for arg in op.metrics]
 
     if op.by:
         group_by = [translate(arg) for arg in op.by]
-        lf = lf.groupby(group_by).agg
+        return lf.groupby(group_by).agg(metrics)
     else:
-        lf = lf.select
-
-    if op.metrics:
-        metrics = [translate(arg) for arg in op.metrics]
-        lf = lf(metrics)
-
-    return lf
+        return lf.select(metrics)
 
 
 _join_types = {
@@ -194,12 +292,6 @@ def join(op):
     left = translate(op.left)
     right = translate(op.right)
 
-    if isinstance(op, ops.RightJoin):
-        how = 'left'
-        left, right = right, left
-    else:
-        how = _join_types[type(op)]
-
     left_on, right_on = [], []
     for pred in op.predicates:
         if isinstance(pred, ops.Equals):
@@ -211,6 +303,15 @@ def join(op):
                 f"with operation type of {type(pred)}"
             )
 
+    # polars builds the hash table from the smaller relation on its own, so
+    # the sides are only swapped to express right joins as left joins
+    if isinstance(op, ops.RightJoin):
+        how = 'left'
+        left, right = right, left
+        left_on, right_on = right_on, left_on
+    else:
+        how = _join_types[type(op)]
+
     return left.join(right, left_on=left_on, right_on=right_on, how=how)
 
 
@@ -236,15 +337,20 @@ def fillna(op):
 
     columns = []
     for name, dtype in op.table.schema.items():
-        column = pl.col(name)
         if isinstance(op.replacements, Mapping):
             value = op.replacements.get(name)
         else:
             _assert_literal(op.replacements)
             value = op.replacements.value
 
-        if value is not None:
-            column = column.fill_nan(value).fill_null(value)
+        # leave the columns without replacement untouched
+        if value is None:
+            continue
+
+        column = pl.col(name)
+        if isinstance(dtype, dt.Floating):
+            column = column.fill_nan(value)
+        column = column.fill_null(value)
 
         # requires special treatment if the fill value has different datatype
         if isinstance(dtype, dt.Timestamp):
@@ -252,7 +358,10 @@ def fillna(op):
 
         columns.append(column)
 
-    return table.select(columns)
+    if columns:
+        return table.with_columns(columns)
+    else:
+        return table
 
 
 @translate.register(ops.IfNull)
@@ -328,8 +437,54 @@ def greatest(op):
     return pl.max(arg)
 
 
+def _literal_is_in(op):
+    """Probe the options of a Contains operation with a single `is_in` call.
+
+    Returns `None` if any of the options is not a non-null scalar literal, or
+    if the value and the options cannot be cast to a common type without
+    losing precision.
+    """
+    options = op.options
+    if not isinstance(options, ops.NodeList):
+        return None
+
+    scalars = (dt.Integer, dt.Floating, dt.String)
+    value_dtype = op.value.output_dtype
+    values = options.values
+    if not isinstance(value_dtype, scalars) or not all(
+        isinstance(option, ops.Literal)
+        and option.value is not None
+        and isinstance(option.dtype, scalars)
+        for option in values
+    ):
+        return None
+
+    try:
+        dtype = dt.highest_precedence(
+            [value_dtype, *(option.dtype for option in values)]
+        )
+    except com.IbisTypeError:
+        return None
+
+    # comparing integers with floats requires the element-wise comparisons,
+    # casting either side would lose precision
+    if isinstance(dtype, dt.Floating) and any(
+        isinstance(d, dt.Integer)
+        for d in (value_dtype, *(option.dtype for option in values))
+    ):
+        return None
+
+    typ = to_polars_type(dtype)
+    value = translate(op.value).cast(typ)
+    return value.is_in(pl.Series([option.value for option in values], dtype=typ))
+
+
 @translate.register(ops.Contains)
 def contains(op):
+    # a single hash set probe instead of one comparison per option
+    if (result := _literal_is_in(op)) is not None:
+        return result
+
     value = translate(op.value)
     options = translate(op.options)
     if isinstance(options, list):
@@ -340,6 +495,9 @@ def contains(op):
 
 @translate.register(ops.NotContains)
 def not_contains(op):
+    if (result := _literal_is_in(op)) is not None:
+        return ~result
+
     value = translate(op.value)
     options = translate(op.options)
     if isinstance(options, list):
@@ -364,24 +522,32 @@ def string_length(op):
     return arg.str.lengths().cast(typ)
 
 
-@translate.register(ops.StringUnary)
-def string_unary(op):
-    arg = translate(op.arg)
-    func = _string_unary[type(op)]
-    method = getattr(arg.str, func)
-    return method()
+def _make_string_unary(method):
+    func = operator.methodcaller(method)
+
+    def string_unary(op):
+        arg = translate(op.arg)
+        return func(arg.str)
+
+    return string_unary
+
+
+_register_simple(_string_unary, _make_string_unary)
 
 
 @translate.register(ops.Capitalize)
 def captalize(op):
     arg = translate(op.arg)
-    return arg.apply(lambda x: x.capitalize())
+    first = arg.str.slice(0, 1).str.to_uppercase()
+    rest = arg.str.slice(1, None).str.to_lowercase()
+    return pl.concat_str([first, rest])
 
 
 @translate.register(ops.Reverse)
 def reverse(op):
     arg = translate(op.arg)
-    return arg.apply(lambda x: x[::-1])
+    # polars has no native string reversal, reverse the list of characters
+    return arg.str.split("").arr.reverse().arr.join("")
 
 
 @translate.register(ops.StringSplit)
@@ -403,7 +569,7 @@ def string_replace(op):
 def string_startswith(op):
     arg = translate(op.arg)
     _assert_literal(op.start)
-    return arg.str.ends_with(op.start.value)
+    return arg.str.starts_with(op.start.value)
 
 
 @translate.register(ops.EndsWith)
@@ -441,11 +607,20 @@ def string_contains(op):
     return haystack.str.contains(op.needle.value)
 
 
+_REGEX_METACHARACTERS = re.compile(r"[\\.^$*+?()\[\]{}|]")
+
+
+def _is_plain(pattern):
+    """Whether a regex pattern only matches itself as a substring."""
+    return _REGEX_METACHARACTERS.search(pattern) is None
+
+
 @translate.register(ops.RegexSearch)
 def regex_search(op):
     arg = translate(op.arg)
     _assert_literal(op.pattern)
-    return arg.str.contains(op.pattern.value)
+    pattern = op.pattern.value
+    return arg.str.contains(pattern, literal=_is_plain(pattern))
 
 
 @translate.register(ops.RegexExtract)
@@ -459,6 +634,15 @@ def regex_extract(op):
 @translate.register(ops.RegexReplace)
 def regex_replace(op):
     arg = translate(op.arg)
+    if (
+        isinstance(op.pattern, ops.Literal)
+        and isinstance(op.replacement, ops.Literal)
+        and _is_plain(pattern := op.pattern.value)
+        # polars expands group references even for literal replacements
+        and "$" not in (replacement := op.replacement.value)
+    ):
+        return arg.str.replace_all(pattern, replacement, literal=True)
+
     pattern = translate(op.pattern)
     replacement = translate(op.replacement)
     return arg.str.replace_all(pattern, replacement)
@@ -536,11 +720,23 @@ def log(op):
     return arg.log(op.base.value)
 
 
+# concatenating a copy of the argument per repetition grows the query plan
+# linearly, so above this count the elementwise callback is faster
+_MAX_CONCAT_REPEAT = 16
+
+
 @translate.register(ops.Repeat)
 def repeat(op):
     arg = translate(op.arg)
     _assert_literal(op.times)
-    return arg.apply(lambda x: x * op.times.value)
+    if (times := op.times.value) <= 0:
+        # empty string preserving the nulls
+        return arg.str.slice(0, 0)
+    if times <= _MAX_CONCAT_REPEAT:
+        # `repeat_by(...).arr.join("")` would be a single kernel, but polars
+        # collapses utf8 columns to a single row there, so concatenate instead
+        return pl.concat_str([arg] * times)
+    return arg.apply(lambda x: x * times)
 
 
 @translate.register(ops.Sign)
@@ -581,14 +777,19 @@ _reductions = {
 }
 
 
-@translate.register(ops.Reduction)
-def reduction(op):
-    arg = translate(op.arg)
-    agg = _reductions[type(op)]
-    if (where := op.where) is not None:
-        arg = arg.filter(translate(where))
-    method = getattr(arg, agg)
-    return method()
+def _make_reduction(method):
+    func = operator.methodcaller(method)
+
+    def reduction(op):
+        arg = translate(op.arg)
+        if (where := op.where) is not None:
+            arg = arg.filter(translate(where))
+        return func(arg)
+
+    return reduction
+
+
+_register_simple(_reductions, _make_reduction)
 
 
 @translate.register(ops.Distinct)
@@ -607,12 +808,12 @@ def count_star(op):
 
 @translate.register(ops.NodeList)
 def node_list(op):
-    return list(map(translate, op.values))
+    return [translate(value) for value in op.values]
 
 
 @translate.register(ops.TimestampNow)
 def timestamp_now(op):
-    now = pd.Timestamp("now", tz="UTC").tz_localize(None)
+    now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
     return pl.lit(now)
 
 
@@ -651,13 +852,31 @@ def date_from_ymd(op):
 def atan2(op):
     left = translate(op.left)
     right = translate(op.right)
-    return pl.map([left, right], lambda cols: np.arctan2(cols[0], cols[1]))
+    # polars has no arctan2 kernel, and its ufunc dispatch only keeps the
+    # nulls of the first operand
+    return (
+        pl.when(left.is_null() | right.is_null())
+        .then(None)
+        .otherwise(pl.map([left, right], lambda cols: np.arctan2(cols[0], cols[1])))
+    )
 
 
 @translate.register(ops.Modulus)
 def modulus(op):
     left = translate(op.left)
     right = translate(op.right)
+    if isinstance(op.output_dtype, dt.Floating):
+        # floored modulo like numpy: shift the native remainder by the
+        # divisor when their signs disagree, and give zeros the divisor's sign
+        rem = left % right
+        return (
+            pl.when(rem == 0)
+            .then(pl.when(right < 0).then(-0.0).otherwise(0.0))
+            .when((rem < 0) != (right < 0))
+            .then(rem + right)
+            .otherwise(rem)
+        )
+    # polars panics on integer remainders with a zero divisor
     return pl.map([left, right], lambda cols: np.mod(cols[0], cols[1]))
 
 
@@ -759,11 +978,17 @@ _date_methods = {
 }
 
 
-@translate.register(ops.ExtractTemporalField)
-def extract_date_field(op):
-    arg = translate(op.arg)
-    method = operator.methodcaller(_date_methods[type(op)])
-    return method(arg.dt).cast(pl.Int32)
+def _make_extract_date_field(method):
+    func = operator.methodcaller(method)
+
+    def extract_date_field(op):
+        arg = translate(op.arg)
+        return func(arg.dt).cast(pl.Int32)
+
+    return extract_date_field
+
+
+_register_simple(_date_methods, _make_extract_date_field)
 
 
 @translate.register(ops.ExtractEpochSeconds)
@@ -798,33 +1023,23 @@ _unary = {
     ops.Tan: operator.methodcaller('tan'),
 }
 
-# ops.DayOfWeekName: lambda arg: arg.dt.weekday().apply(lambda x: _WEEKDAY.get(x)),
-
-_WEEKDAY = {
-    0: "Monday",
-    1: "Tuesday",
-    2: "Wednesday",
-    3: "Thursday",
-    4: "Friday",
-    5: "Saturday",
-    6: "Sunday",
-}
-
 
 @translate.register(ops.DayOfWeekName)
 def day_of_week_name(op):
-    index = translate(op.arg).dt.weekday()
-    arg = None
-    for i, name in reversed(_WEEKDAY.items()):
-        arg = pl.when(index == i).then(name).otherwise(arg)
-    return arg
+    arg = translate(op.arg)
+    # chrono formats the full english weekday name in a single kernel
+    return arg.dt.strftime("%A")
 
 
-@translate.register(ops.Unary)
-def unary(op):
-    arg = translate(op.arg)
-    func = _unary[type(op)]
-    return func(arg)
+def _make_unary(func):
+    def unary(op):
+        arg = translate(op.arg)
+        return func(arg)
+
+    return unary
+
+
+_register_simple(_unary, _make_unary)
 
 
 _comparisons = {
@@ -837,12 +1052,16 @@ _comparisons = {
 }
 
 
-@translate.register(ops.Comparison)
-def comparison(op):
-    left = translate(op.left)
-    right = translate(op.right)
-    func = _comparisons[type(op)]
-    return func(left, right)
+def _make_binop(func):
+    def binop(op):
+        left = translate(op.left)
+        right = translate(op.right)
+        return func(left, right)
+
+    return binop
+
+
+_register_simple(_comparisons, _make_binop)
 
 
 @translate.register(ops.Between)
@@ -861,18 +1080,34 @@ _bitwise_binops = {
     ops.BitwiseXor: np.bitwise_xor,
 }
 
+_native_bitwise_binops = {
+    ops.BitwiseOr: operator.or_,
+    ops.BitwiseAnd: operator.and_,
+    ops.BitwiseXor: operator.xor,
+}
+
 
 @translate.register(ops.BitwiseBinary)
 def bitwise_binops(op):
-    ufunc = _bitwise_binops[type(op)]
     left = translate(op.left)
     right = translate(op.right)
 
-    if isinstance(op.right, ops.Literal):
+    left_literal = isinstance(op.left, ops.Literal)
+    right_literal = isinstance(op.right, ops.Literal)
+
+    # polars' bitwise kernels don't broadcast a literal against a column and
+    # it has no shift kernels, so only those cases go through numpy
+    func = _native_bitwise_binops.get(type(op))
+    if func is not None and left_literal == right_literal:
+        result = func(left, right)
+    elif right_literal:
+        ufunc = _bitwise_binops[type(op)]
         result = left.map(lambda col: ufunc(col, op.right.value))
-    elif isinstance(op.left, ops.Literal):
+    elif left_literal:
+        ufunc = _bitwise_binops[type(op)]
         result = right.map(lambda col: ufunc(op.left.value, col))
     else:
+        ufunc = _bitwise_binops[type(op)]
         result = pl.map([left, right], lambda cols: ufunc(cols[0], cols[1]))
 
     return result.cast(to_polars_type(op.output_dtype))
@@ -881,7 +1116,11 @@ def bitwise_binops(op):
 @translate.register(ops.BitwiseNot)
 def bitwise_not(op):
     arg = translate(op.arg)
-    return arg.map(lambda x: np.invert(x))
+    dtype = op.output_dtype
+    typ = to_polars_type(dtype)
+    # two's complement inversion: ~x == -1 - x and ~x == MAX - x if unsigned
+    ones = dtype.bounds.upper if isinstance(dtype, dt.UnsignedInteger) else -1
+    return (pl.lit(ones, dtype=typ) - arg).cast(typ)
 
 
 _binops = {
@@ -898,12 +1137,7 @@ _binops = {
 }
 
 
-@translate.register(ops.Binary)
-def binop(op):
-    left = translate(op.left)
-    right = translate(op.right)
-    func = _binops[type(op)]
-    return func(left, right)
+_register_simple(_binops, _make_binop)
 
 
 @translate.register(ops.ElementWiseVectorizedUDF)
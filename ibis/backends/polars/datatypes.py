@@ -31,18 +31,26 @@ _to_polars_types = {
 _to_ibis_dtypes = {v: k for k, v in _to_polars_types.items()}
 
 
-@functools.singledispatch
+@functools.lru_cache(maxsize=1024)
 def to_polars_type(dtype):
-    """Convert ibis dtype to the polars counterpart."""
+    """Convert ibis dtype to the polars counterpart.
+
+    ibis dtypes are immutable and hashable, so the conversion is memoized.
+    """
+    return _to_polars_type(dtype)
+
+
+@functools.singledispatch
+def _to_polars_type(dtype):
     return _to_polars_types[dtype.__class__]  # else return  pl.Object?
 
 
-@to_polars_type.register(dt.Timestamp)
+@_to_polars_type.register(dt.Timestamp)
 def from_ibis_timestamp(dtype):
     return pl.Datetime("ns", dtype.timezone)
 
 
-@to_polars_type.register(dt.Interval)
+@_to_polars_type.register(dt.Interval)
 def from_ibis_interval(dtype):
     if dtype.unit in {'us', 'ns', 'ms'}:
         return pl.Duration(dtype.unit)
@@ -50,7 +58,7 @@ def from_ibis_interval(dtype):
         raise ValueError(f"Unsupported polars duration unit: {dtype.unit}")
 
 
-@to_polars_type.register(dt.Struct)
+@_to_polars_type.register(dt.Struct)
 def from_ibis_struct(dtype):
     fields = [
         pl.Field(name=name, dtype=to_polars_type(dtype))
@@ -59,12 +67,12 @@ def from_ibis_struct(dtype):
     return pl.Struct(fields)
 
 
-@to_polars_type.register(dt.Category)
+@_to_polars_type.register(dt.Category)
 def from_ibis_category(dtype):
     return pl.Categorical
 
 
-@to_polars_type.register(dt.Array)
+@_to_polars_type.register(dt.Array)
 def from_ibis_array(dtype):
     return pl.List(to_polars_type(dtype.value_type))
 
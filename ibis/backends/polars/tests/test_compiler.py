@@ -0,0 +1,133 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+import pandas.testing as tm
+import pytest
+
+import ibis
+
+pytest.importorskip("polars")
+
+
+@pytest.fixture(scope="module")
+def con():
+    con = ibis.polars.connect({})
+    con.register_pandas(
+        "t",
+        pd.DataFrame(
+            {
+                "i": [-1, 0, 1, 2, 3],
+                "f": [7.0, -7.0, 1e20, 123456789.123, -0.5],
+                "s": ["a", "b", "c", "d", None],
+            }
+        ),
+    )
+    con.register_pandas("r", pd.DataFrame({"kk": ["b", "d", "z"], "v": [10, 20, 30]}))
+    con.register_pandas(
+        "m",
+        pd.DataFrame(
+            {
+                "i": [-4, -1, 0, 1, 2, 3, 4],
+                "f": [0.0, -0.0, 4.0, -4.0, 7.0, 1e20, -0.5],
+            }
+        ),
+    )
+    return con
+
+
+@pytest.fixture(scope="module")
+def t(con):
+    return con.table("t")
+
+
+@pytest.mark.parametrize(
+    ("func", "expected"),
+    [
+        (lambda t: t.i.isin([1.0, 2.5]), [False, False, True, False, False]),
+        (lambda t: t.i.notin([1.0, 2.5]), [True, True, False, True, True]),
+        (lambda t: t.i.isin([1, 3]), [False, False, True, False, True]),
+        (lambda t: t.i.notin([1, 3]), [True, True, False, True, False]),
+        (lambda t: t.f.isin([7.0, -0.5]), [True, False, False, False, True]),
+        (lambda t: (t.i > 0).isin([True]), [False, False, True, True, True]),
+        (lambda t: (t.i > 0).notin([True]), [True, True, False, False, False]),
+        (lambda t: t.s.isin(["a", "c"]), [True, False, True, False, False]),
+    ],
+)
+def test_isin_literal_options(con, t, func, expected):
+    result = con.execute(func(t))
+    assert result.tolist() == expected
+
+
+@pytest.mark.parametrize(
+    ("func", "divisor"),
+    [
+        (lambda m: m.f % 3.0, 3.0),
+        (lambda m: m.f % -3.0, -3.0),
+        (lambda m: m.f % 2.0, 2.0),
+        (lambda m: m.f % -2.0, -2.0),
+        (lambda m: m.f % 0.001, 0.001),
+        (lambda m: m.f % float("inf"), np.inf),
+        (lambda m: m.f % float("-inf"), -np.inf),
+        (lambda m: m.i % 2.5, 2.5),
+        (lambda m: m.i % -2.0, -2.0),
+    ],
+)
+def test_floating_modulus_matches_numpy(con, func, divisor):
+    m = con.table("m")
+    expr = func(m)
+    column = expr.op().left.name
+    result = con.execute(expr).to_numpy()
+    expected = np.mod(con.execute(m[column]).to_numpy(), divisor)
+    np.testing.assert_array_equal(result, expected)
+    np.testing.assert_array_equal(np.signbit(result), np.signbit(expected))
+
+
+def test_right_join_on_differently_named_keys(con, t):
+    r = con.table("r")
+    expr = t.right_join(r, t.s == r.kk)[t.i, r.kk, r.v]
+    result = con.execute(expr).sort_values("kk").reset_index(drop=True)
+    expected = pd.DataFrame(
+        {"i": [0.0, 2.0, np.nan], "kk": ["b", "d", "z"], "v": [10, 20, 30]}
+    )
+    tm.assert_frame_equal(result, expected)
+
+
+def test_atan2_matches_numpy(con):
+    values = [0.0, -0.0, 1.0, -1.0, np.inf, -np.inf, np.nan]
+    y, x = map(np.array, zip(*itertools.product(values, values)))
+    con.register_pandas("angles", pd.DataFrame({"y": y, "x": x}))
+    angles = con.table("angles")
+    result = con.execute(angles.y.atan2(angles.x)).to_numpy()
+    expected = np.arctan2(y, x)
+    np.testing.assert_array_equal(result, expected)
+    np.testing.assert_array_equal(np.signbit(result), np.signbit(expected))
+
+
+def test_atan2_propagates_nulls(con):
+    con.register_pandas(
+        "nullable",
+        pd.DataFrame(
+            {
+                "y": pd.array([1, None, 3], dtype="Int64"),
+                "x": pd.array([1, 2, None], dtype="Int64"),
+            }
+        ),
+    )
+    nullable = con.table("nullable")
+    result = con.execute(nullable.y.atan2(nullable.x))
+    assert result.isna().tolist() == [False, True, True]
+
+
+@pytest.mark.parametrize("times", [-1, 0, 1, 3, 100])
+def test_repeat(con, t, times):
+    result = con.execute(t.s.repeat(times))
+    expected = con.execute(t.s).map(lambda x: x * times, na_action="ignore")
+    tm.assert_series_equal(result, expected, check_names=False)
+
+
+def test_equal_literals_with_different_signs(con, t):
+    expr = t.mutate(p=t.f / ibis.literal(0.0), n=t.f / ibis.literal(-0.0))
+    result = con.execute(expr)
+    tm.assert_series_equal(result.n, -result.p, check_names=False)
+    assert np.isinf(result.p).all()
@@ -178,6 +178,18 @@ def test_string_col_is_unicode(alltypes, df):
             id='endswith',
             marks=pytest.mark.notimpl(["dask", "datafusion", "pandas"]),
         ),
+        param(
+            lambda t: t.date_string_col.startswith('01'),
+            lambda t: t.date_string_col.str.startswith('01'),
+            id='startswith_match',
+            marks=pytest.mark.notimpl(["dask", "datafusion", "pandas"]),
+        ),
+        param(
+            lambda t: t.date_string_col.endswith('/10'),
+            lambda t: t.date_string_col.str.endswith('/10'),
+            id='endswith_match',
+            marks=pytest.mark.notimpl(["dask", "datafusion", "pandas"]),
+        ),
         param(
             lambda t: t.string_col.strip(),
             lambda t: t.string_col.str.strip(),
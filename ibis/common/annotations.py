@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import inspect
 from typing import Any
+from weakref import WeakValueDictionary
 
 from ibis.common.validators import option, tuple_of
 from ibis.util import DotDict
@@ -11,19 +12,67 @@ VAR_POSITIONAL = inspect.Parameter.VAR_POSITIONAL
 POSITIONAL_OR_KEYWORD = inspect.Parameter.POSITIONAL_OR_KEYWORD
 KEYWORD_ONLY = inspect.Parameter.KEYWORD_ONLY
 
+# sources of the argument values in a binding plan, see Signature.validate
+_POSITIONAL = 'positional'
+_VARIADIC = 'variadic'
+_KEYWORD = 'keyword'
+_DEFAULT = 'default'
+
 
 def _noop(arg, **kwargs):
     return arg
 
 
+# The caches below are keyed by the ids of the objects a value was built
+# from and hold the values weakly. Every cached value keeps those objects
+# alive, so their ids cannot be reused by other objects while the entry
+# remains in the cache.
+
+# wrapping validators shared between the annotations built from the same
+# inner validator
+_wrapped_validators = WeakValueDictionary()
+
+
+def _wrap(wrapper, *args, **kwargs):
+    key = (wrapper, *map(id, args), *((k, id(v)) for k, v in kwargs.items()))
+    try:
+        return _wrapped_validators[key]
+    except KeyError:
+        validator = _wrapped_validators[key] = wrapper(*args, **kwargs)
+        return validator
+
+
 class Annotation:
     """Base class for all annotations."""
 
-    __slots__ = ('_validator',)
+    __slots__ = ('_validator', '__weakref__')
+
+    # identical annotations are shared between the annotated classes
+    __instances__ = WeakValueDictionary()
 
     def __init__(self, validator=None):
         self._validator = validator
 
+    @classmethod
+    def _intern(cls, *args):
+        # identity keyed weak cache, see _wrapped_validators
+        key = (cls, *map(id, args))
+        try:
+            return cls.__instances__[key]
+        except KeyError:
+            instance = cls.__instances__[key] = object.__new__(cls)
+            return instance
+
+    # annotations are immutable and possibly shared, so never copy them
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (self.__class__, (self._validator,))
+
     def validate(self, arg, **kwargs):
         if self._validator is None:
             return arg
@@ -44,16 +93,22 @@ class Attribute(Annotation):
 
     __slots__ = ('_default',)
 
+    def __new__(cls, validator=None, default=EMPTY):
+        return cls._intern(validator, default)
+
     def __init__(self, validator=None, default=EMPTY):
         self._default = default
         self._validator = validator
 
+    def __reduce__(self):
+        return (self.__class__, (self._validator, self._default))
+
     @classmethod
     def default(self, fn):
         return Attribute(default=fn)
 
     def __eq__(self, other):
-        return (
+        return self is other or (
             type(self) is type(other)
             and self._default == other._default
             and self._validator == other._validator
@@ -71,13 +126,19 @@ class Argument(Annotation):
 
     __slots__ = ('_kind', '_default')
 
+    def __new__(cls, kind, default=EMPTY, validator=None):
+        return cls._intern(kind, default, validator)
+
     def __init__(self, kind, default=EMPTY, validator=None):
         self._kind = kind
         self._default = default
         self._validator = validator
 
+    def __reduce__(self):
+        return (self.__class__, (self._kind, self._default, self._validator))
+
     def __eq__(self, other):
-        return (
+        return self is other or (
             type(self) is type(other)
             and self._kind == other._kind
             and self._default == other._default
@@ -110,18 +171,18 @@ class Argument(Annotation):
     def optional(cls, validator=None, default=None):
         """Annotation to allow and treat `None` values as missing arguments."""
         if validator is None:
-            validator = option(_noop, default=default)
+            validator = _wrap(option, _noop, default=default)
         else:
-            validator = option(validator, default=default)
+            validator = _wrap(option, validator, default=default)
         return cls(POSITIONAL_OR_KEYWORD, default=None, validator=validator)
 
     @classmethod
     def variadic(cls, validator=None):
         """Annotation variadic positional arguments."""
         if validator is None:
-            validator = tuple_of(_noop)
+            validator = _wrap(tuple_of, _noop)
         else:
-            validator = tuple_of(validator)
+            validator = _wrap(tuple_of, validator)
         return cls(VAR_POSITIONAL, validator=validator)
 
 
@@ -135,12 +196,13 @@ class Parameter(inspect.Parameter):
             raise TypeError(
                 f'annotation must be an instance of Argument, got {annotation}'
             )
-        super().__init__(
-            name,
-            kind=annotation._kind,
-            default=annotation._default,
-            annotation=annotation._validator,
-        )
+        # the names are class attribute names and the kinds and defaults are
+        # guaranteed to be consistent by the Argument constructors, so set the
+        # fields directly instead of repeating the checks of inspect.Parameter
+        self._name = name
+        self._kind = annotation._kind
+        self._default = annotation._default
+        self._annotation = annotation._validator
 
     def validate(self, arg, *, this):
         if self.annotation is None:
@@ -155,7 +217,28 @@ class Signature(inspect.Signature):
     ibis.common.grounds.Annotable.
     """
 
-    __slots__ = ()
+    __slots__ = ('_plans', '_params', '_names', '_variadic', '_sources', '__weakref__')
+
+    # signatures already produced by merge()
+    __merged__ = WeakValueDictionary()
+
+    # signatures shared between identical parameter lists, see intern()
+    __interned__ = WeakValueDictionary()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # binding plans keyed by the shape of the call, see validate()
+        self._plans = {}
+        # iterating over a tuple is cheaper than over the parameters mapping
+        self._params = tuple(self.parameters.values())
+        # parameter names and the position of the variadic one, see unbind()
+        self._names = tuple(param.name for param in self._params)
+        self._variadic = next(
+            (i for i, param in enumerate(self._params) if param.kind == VAR_POSITIONAL),
+            None,
+        )
+        # inputs of the merge() calls resolving to this signature
+        self._sources = ()
 
     @classmethod
     def merge(cls, *signatures, **annotations):
@@ -175,11 +258,31 @@ class Signature(inspect.Signature):
         -------
         Signature
         """
+        # classes without new arguments or sharing the interned annotations
+        # of their siblings resolve to the same signature; identity keyed
+        # weak cache, see _wrapped_validators
+        key = (
+            cls,
+            *map(id, signatures),
+            *((name, id(annot)) for name, annot in annotations.items()),
+        )
+        try:
+            return cls.__merged__[key]
+        except KeyError:
+            pass
+
+        merged = cls.__merged__[key] = cls._merge(signatures, annotations)
+        merged._sources += ((signatures, annotations),)
+        return merged
+
+    @classmethod
+    def _merge(cls, signatures, annotations):
         params = {}
         inherited = set()
         is_variadic = False
         for sig in signatures:
-            for name, param in sig.parameters.items():
+            for param in sig._params:
+                name = param.name
                 is_variadic |= param.kind == VAR_POSITIONAL
                 params[name] = param
                 inherited.add(name)
@@ -208,7 +311,34 @@ class Signature(inspect.Signature):
                 else:
                     new_kwargs.append(param)
 
-        return cls(inherited_args + new_args + new_kwargs + inherited_kwargs)
+        return cls.intern(inherited_args + new_args + new_kwargs + inherited_kwargs)
+
+    @classmethod
+    def intern(cls, parameters):
+        """Return a shared signature for the given parameters.
+
+        Parameters are considered identical if they have the same name and
+        kind and the very same default value and validator objects.
+
+        Parameters
+        ----------
+        parameters : Sequence[Parameter]
+            Parameters of the signature.
+
+        Returns
+        -------
+        Signature
+        """
+        parameters = tuple(parameters)
+        # identity keyed weak cache, see _wrapped_validators
+        key = (cls,) + tuple(
+            (p.name, p.kind, id(p.default), id(p.annotation)) for p in parameters
+        )
+        try:
+            return cls.__interned__[key]
+        except KeyError:
+            signature = cls.__interned__[key] = cls(parameters)
+            return signature
 
     def unbind(self, this: Any):
         """Reverse bind of the parameters.
@@ -229,18 +359,16 @@ class Signature(inspect.Signature):
             Tuple of positional and keyword arguments.
         """
         # does the reverse of bind, but doesn't apply defaults
-        args, kwargs = (), {}
+        names = self._names
+        values = [getattr(this, name) for name in names]
 
-        for name, param in self.parameters.items():
-            value = getattr(this, name)
-            if param.kind == VAR_POSITIONAL:
-                # need to adjust due to the variadic argument: fn(a, b, *args)
-                # cannot be called again as fn(*args, a=..., b=...)
-                args = tuple(kwargs.values()) + value
-                kwargs = {}
-            else:
-                kwargs[name] = value
+        if (i := self._variadic) is None:
+            return (), dict(zip(names, values))
 
+        # need to adjust due to the variadic argument: fn(a, b, *args)
+        # cannot be called again as fn(*args, a=..., b=...)
+        args = (*values[:i], *values[i])
+        kwargs = dict(zip(names[i + 1 :], values[i + 1 :]))
         return args, kwargs
 
     def validate(self, *args, **kwargs):
@@ -258,20 +386,79 @@ class Signature(inspect.Signature):
         validated : dict
             Dictionary of validated arguments.
         """
-        # bind the signature to the passed arguments and apply the validators
-        # before passing the arguments, so self.__init__() receives already
-        # validated arguments as keywords
-        bound = self.bind(*args, **kwargs)
-        bound.apply_defaults()
-
+        # the binding only depends on the number of positional arguments and
+        # on the passed keywords, so resolve it once per call shape
+        shape = (len(args), tuple(kwargs))
+        if (plan := self._plans.get(shape)) is None:
+            plan = self._plans[shape] = self._plan(*shape)
+
+        # apply the validators before passing the arguments, so
+        # self.__init__() receives already validated arguments as keywords;
+        # the result must stay a mapping since validators look up the already
+        # validated arguments with this[name] and callers unpack it as kwargs
         this = DotDict()
-        for name, value in bound.arguments.items():
-            param = self.parameters[name]
+        for name, validator, source, key in plan:
+            if source is _POSITIONAL:
+                value = args[key]
+            elif source is _KEYWORD:
+                value = kwargs[key]
+            elif source is _VARIADIC:
+                value = args[key:]
+            else:
+                value = key
             # TODO(kszucs): provide more error context on failure
-            this[name] = param.validate(value, this=this)
+            this[name] = validator(value, this=this)
 
         return this
 
+    def _plan(self, nargs, kwnames):
+        """Resolve where the value of each parameter is taken from.
+
+        Parameters
+        ----------
+        nargs : int
+            Number of positional arguments.
+        kwnames : tuple
+            Names of the keyword arguments.
+
+        Returns
+        -------
+        plan : tuple
+            Tuple of (name, validator, source, key) quadruples in parameter
+            order, where key is either the positional index, the keyword name
+            or the default value.
+        """
+        # the errors follow the ones raised by inspect.Signature.bind
+        kinds = [param.kind for param in self._params]
+        if VAR_POSITIONAL not in kinds and nargs > kinds.count(POSITIONAL_OR_KEYWORD):
+            raise TypeError('too many positional arguments')
+
+        plan, position, unused = [], 0, set(kwnames)
+        for name, param in zip(self._names, self._params):
+            # call the validators directly instead of through Parameter.validate
+            validator = _noop if param.annotation is None else param.annotation
+            if param.kind == VAR_POSITIONAL:
+                plan.append((name, validator, _VARIADIC, position))
+                position = nargs
+            elif param.kind == POSITIONAL_OR_KEYWORD and position < nargs:
+                if name in unused:
+                    raise TypeError(f'multiple values for argument {name!r}')
+                plan.append((name, validator, _POSITIONAL, position))
+                position += 1
+            elif name in unused:
+                unused.remove(name)
+                plan.append((name, validator, _KEYWORD, name))
+            elif param.default is not EMPTY:
+                plan.append((name, validator, _DEFAULT, param.default))
+            else:
+                raise TypeError(f'missing a required argument: {name!r}')
+
+        if unused:
+            name = next(name for name in kwnames if name in unused)
+            raise TypeError(f'got an unexpected keyword argument {name!r}')
+
+        return tuple(plan)
+
 
 # aliases for convenience
 attribute = Attribute
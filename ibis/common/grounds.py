@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from abc import ABCMeta, abstractmethod
 from copy import copy
+from types import MemberDescriptorType
 from typing import Any
 from weakref import WeakValueDictionary
 
@@ -93,7 +94,18 @@ class AnnotableMeta(BaseMeta):
             __signature__=signature,
             __slots__=tuple(slots),
         )
-        return super().__new__(metacls, clsname, bases, namespace, **kwargs)
+        cls = super().__new__(metacls, clsname, bases, namespace, **kwargs)
+
+        # plain class attributes and properties, defined either on this class
+        # or on a base class preceding the field's owner in the mro, override
+        # the inherited fields which therefore must not be initialized
+        for name, field in tuple(attributes.items()):
+            if isinstance(field, Attribute):
+                owner = next(k for k in cls.__mro__ if name in vars(k))
+                if not isinstance(vars(owner)[name], MemberDescriptorType):
+                    del attributes[name]
+
+        return cls
 
 
 class Annotable(Base, metaclass=AnnotableMeta):
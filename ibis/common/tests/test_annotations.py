@@ -1,9 +1,13 @@
+import copy
+import gc
 import inspect
+import pickle
+import weakref
 
 import pytest
 from toolz import identity
 
-from ibis.common.annotations import Argument, Attribute, Parameter, Signature
+from ibis.common.annotations import EMPTY, Argument, Attribute, Parameter, Signature
 from ibis.common.validators import instance_of, option
 
 is_int = instance_of(int)
@@ -69,6 +73,53 @@ def test_initialized():
     assert field2.initialize(Foo) == '10'
 
 
+def test_annotations_are_interned():
+    assert Argument.mandatory(is_int) is Argument.mandatory(is_int)
+    assert Argument.default(1, is_int) is Argument.default(1, is_int)
+    assert Argument.default(1, is_int) is not Argument.default(True, is_int)
+    assert Argument.mandatory(is_int) is not Argument.mandatory_keyword(is_int)
+    assert Argument.mandatory() is Argument.mandatory()
+    assert Argument.optional() is Argument.optional()
+    assert Argument.optional(is_int, default=1) is Argument.optional(is_int, default=1)
+    assert Argument.optional(default=1) is not Argument.optional(default=True)
+    assert Argument.variadic() is Argument.variadic()
+    assert Argument.variadic(is_int) is Argument.variadic(is_int)
+
+    fn = lambda self: self.a  # noqa: E731
+    assert Attribute.default(fn) is Attribute.default(fn)
+    assert Attribute.default(fn) is not Attribute(is_int, fn)
+
+
+def _triple(self):
+    return self.a * 3
+
+
+@pytest.mark.parametrize(
+    "annotation",
+    [
+        Argument.mandatory(is_int),
+        Argument.default(1),
+        Argument.optional(is_int, default=2),
+        Argument.variadic(is_int),
+        Attribute(is_int),
+        Attribute.default(_triple),
+    ],
+)
+def test_annotations_copy_and_pickle(annotation):
+    assert copy.copy(annotation) is annotation
+    assert copy.deepcopy(annotation) is annotation
+
+    restored = pickle.loads(pickle.dumps(annotation))
+    assert restored == annotation
+    assert restored.__reduce__() == annotation.__reduce__()
+
+
+def test_copying_an_attribute_does_not_mutate_the_interned_instance():
+    empty = Attribute()
+    assert copy.copy(Attribute.default(_triple)) is not empty
+    assert empty._default is EMPTY
+
+
 def test_parameter():
     def fn(x, this):
         return int(x) + this['other']
@@ -165,3 +216,85 @@ def test_signature_unbind_nonempty_variadic():
     assert kwargs == {'e': 4.0}
     params_again = sig.validate(*args, **kwargs)
     assert params_again == params
+
+
+def test_signature_validate_reuses_binding_plans():
+    sig = Signature(parameters=[a, b, d, e])
+    expected = {'a': 1.0, 'b': 2.0, 'd': (), 'e': 5.0}
+
+    assert sig.validate(1, 2, e=5) == expected
+    assert sig.validate(1, b=2, e=5) == expected
+    assert sig.validate(e=5, b=2, a=1) == expected
+    assert sig.validate(1, 2, 3, 4, e=5) == {**expected, 'd': (3.0, 4.0)}
+    assert sig.validate(1, 2, e=5) == expected
+    assert len(sig._plans) == 4
+
+    with pytest.raises(TypeError, match="missing a required argument: 'e'"):
+        sig.validate(1, 2)
+    with pytest.raises(TypeError, match="unexpected keyword argument 'f'"):
+        sig.validate(1, 2, e=5, f=6)
+    assert len(sig._plans) == 4
+
+
+def test_signature_validate_passes_previously_validated_arguments():
+    seen = []
+
+    def record(x, this):
+        seen.append(dict(this))
+        return x
+
+    params = [Parameter(name, annotation=Argument.mandatory(record)) for name in "xyz"]
+    sig = Signature(parameters=params)
+
+    assert sig.validate(z=3, y=2, x=1) == {'x': 1, 'y': 2, 'z': 3}
+    assert seen == [{}, {'x': 1}, {'x': 1, 'y': 2}]
+
+
+def test_signature_merge_is_cached():
+    base = Signature(parameters=[a, b])
+    annot = Argument.default(1.0, as_float)
+
+    merged = Signature.merge(base, x=annot)
+    assert Signature.merge(base, x=annot) is merged
+    assert Signature.merge(base, y=annot) is not merged
+    assert Signature.merge(base) is not merged
+    assert tuple(merged.parameters) == ('a', 'b', 'x')
+
+
+@pytest.mark.parametrize(
+    ('args', 'kwargs'),
+    [
+        ((1, 2, 3), {}),
+        ((1,), {}),
+        ((1,), dict(a=1, b=2)),
+        ((1, 2), dict(c=3)),
+        ((), dict(b=2)),
+    ],
+)
+def test_signature_validate_errors_match_bind(args, kwargs):
+    sig = Signature(parameters=[a, b])
+    with pytest.raises(TypeError) as expected:
+        sig.bind(*args, **kwargs)
+    with pytest.raises(TypeError, match=f"^{expected.value}$"):
+        sig.validate(*args, **kwargs)
+
+
+def test_signature_intern():
+    sig = Signature.intern([a, b])
+    assert Signature.intern((a, b)) is sig
+    assert Signature.intern([Parameter('a', Argument.mandatory(as_float)), b]) is sig
+    assert Signature.intern([b, a]) is not sig
+    assert Signature.intern([a, c]) is not sig
+    assert sig == Signature([a, b])
+
+
+def test_signature_caches_do_not_keep_their_entries_alive():
+    annot = Argument.optional(lambda x, **kwargs: x)
+    base = Signature.intern([a, Parameter('v', annot)])
+    merged = Signature.merge(base, x=Argument.default(1.0, as_float))
+    refs = list(map(weakref.ref, (annot._validator, base, merged)))
+    assert Signature.merge(base, x=Argument.default(1.0, as_float)) is merged
+
+    del annot, base, merged
+    gc.collect()
+    assert [ref() for ref in refs] == [None, None, None]
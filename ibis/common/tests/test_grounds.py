@@ -527,6 +527,36 @@ def test_initialized_attribute_mixed_with_classvar():
     assert "output_shape" in v.__slots__
 
 
+def test_initialized_attribute_overridden_by_classvar():
+    class Value(Annotable):
+        arg = is_int
+
+        @attribute.default
+        def output_shape(self):
+            return "like-arg"
+
+    class Reduction(Value):
+        output_shape = "scalar"
+
+    class Window(Value):
+        @property
+        def output_shape(self):
+            return "columnar"
+
+    class Scalar(Annotable):
+        output_shape = "scalar"
+
+    class ScalarValue(Scalar, Value):
+        pass
+
+    assert Value(1).output_shape == "like-arg"
+    assert Reduction(1).output_shape == "scalar"
+    assert Window(1).output_shape == "columnar"
+    assert ScalarValue(1).output_shape == "scalar"
+    assert "output_shape" not in Reduction.__attributes__
+    assert "output_shape" not in ScalarValue.__attributes__
+
+
 class Node(Comparable):
 
     # override the default cache object
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+from abc import abstractmethod
 from typing import Sequence
 
 from public import public
 
 import ibis.expr.rules as rlz
+from ibis.common.annotations import attribute
 from ibis.common.grounds import Concrete
 from ibis.expr.rules import Shape
 from ibis.util import UnnamedMarker, deprecated
@@ -14,6 +15,8 @@ from ibis.util import UnnamedMarker, deprecated
 @public
 class Node(Concrete):
     def equals(self, other):
+        if self is other:
+            return True
         if not isinstance(other, Node):
             raise TypeError(
                 "invalid equality comparison between Node and " f"{type(other)}"
@@ -31,12 +34,18 @@ class Node(Concrete):
 
 
 @public
-class Named(ABC):
+class Named:
+    """Mixin for operations with a name.
+
+    A plain class rather than an ABC, so the frequent `isinstance` checks
+    against it avoid the ABCMeta subclass hooks. Being no ABC, its abstract methods
+    aren't collected by ABCMeta either, so the `Node` subclasses mixing it in
+    declare `name` abstract themselves.
+    """
 
     __slots__ = tuple()
 
     @property
-    @abstractmethod
     def name(self):
         """Name of the operation.
 
@@ -49,12 +58,21 @@ class Named(ABC):
 @public
 class Value(Node, Named):
 
+    __slots__ = ('_name',)
+
     # TODO(kszucs): cover it with tests
     # TODO(kszucs): figure out how to represent not named arguments
     @property
     def name(self):
+        # the node is immutable, so compute the name only on first access
+        try:
+            return self._name
+        except AttributeError:
+            pass
         args = ", ".join(arg.name for arg in self.__args__ if isinstance(arg, Named))
-        return f"{self.__class__.__name__}({args})"
+        name = f"{self.__class__.__name__}({args})"
+        object.__setattr__(self, "_name", name)
+        return name
 
     @property
     @abstractmethod
@@ -100,7 +118,7 @@ class Unary(Value):
 
     arg = rlz.any
 
-    @property
+    @attribute.default
     def output_shape(self):
         return self.arg.output_shape
 
@@ -112,7 +130,7 @@ class Binary(Value):
     left = rlz.any
     right = rlz.any
 
-    @property
+    @attribute.default
     def output_shape(self):
         return max(self.left.output_shape, self.right.output_shape)
 
@@ -134,13 +152,27 @@ class NodeList(Node, Sequence[Node]):
     def __getitem__(self, index):
         return self.values[index]
 
+    @classmethod
+    def _from_validated(cls, values):
+        # bypass the signature validation for already validated values
+        return type.__call__(cls, values=values)
+
+    @staticmethod
+    def _validate_values(values):
+        # the values of another node list are already validated
+        if isinstance(values, NodeList):
+            return values.values
+        return rlz.tuple_of(rlz.instance_of(Node), values)
+
     def __add__(self, other):
-        values = self.values + tuple(other)
-        return self.__class__(*values)
+        if not (values := self._validate_values(other)):
+            return self
+        return self._from_validated(self.values + values)
 
     def __radd__(self, other):
-        values = tuple(other) + self.values
-        return self.__class__(*values)
+        if not (values := self._validate_values(other)):
+            return self
+        return self._from_validated(values + self.values)
 
     def to_expr(self):
         import ibis.expr.types as ir
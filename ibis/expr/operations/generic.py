@@ -349,6 +349,9 @@ class SearchedCase(Value):
 
 
 class _Negatable(abc.ABC):
+
+    __slots__ = ()
+
     @abc.abstractmethod
     def negate(self):  # pragma: no cover
         ...
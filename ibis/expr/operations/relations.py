@@ -42,7 +42,10 @@ class TableNode(Node):
 
 @public
 class PhysicalTable(TableNode, Named):
-    pass
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Return the name of the table."""
 
 
 @public
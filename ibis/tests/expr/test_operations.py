@@ -273,3 +273,37 @@ def test_expression_class_aliases():
     assert ir.AnyColumn is ir.Column
     assert ir.ListExpr is ir.List
     assert ir.ValueList is ir.List
+
+
+def test_value_name_is_computed_once():
+    op = ops.Add(t.a, ops.Multiply(t.a, 2))
+    assert op.name == "Add(a, Multiply(a, 2))"
+    assert op.name is op.name
+    assert op.copy(right=ops.Literal(3, dtype=dt.int8)).name == "Add(a, 3)"
+
+
+def test_node_list_concatenation():
+    a, b = t.a.op(), ops.Literal(1, dtype=dt.int8)
+    values = ops.NodeList(a, b)
+
+    assert values + [b] == ops.NodeList(a, b, b)
+    assert [b] + values == ops.NodeList(b, a, b)
+    assert hash(values + (a,)) == hash(ops.NodeList(a, b, a))
+    assert values + values == ops.NodeList(a, b, a, b)
+    assert values + [] is values
+    assert () + values is values
+
+    with pytest.raises(IbisTypeError):
+        values + [1]
+
+
+@pytest.mark.parametrize(
+    "klass",
+    [
+        klass
+        for klass in vars(ops).values()
+        if isinstance(klass, type) and issubclass(klass, ops.Node)
+    ],
+)
+def test_operations_have_no_instance_dict(klass):
+    assert klass.__dictoffset__ == 0